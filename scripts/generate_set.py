@@ -27,7 +27,24 @@ def main() -> None:
     sequence_length = arguments.seq_length
 
     with open(arguments.file, 'w+') as json_io:
-        json_io.write(json.dumps(generate_permutations_with_replacement(width, sequence_length)))
+        write_permutations(json_io, width, sequence_length)
+
+
+def write_permutations(json_io: typing.TextIO, width: int, seq_length: int) -> None:
+    """Writes all seq_length**width possible permutations as a json array, one permutation at a time so the full list
+    is never held in memory.
+
+    :param json_io: A text stream to write to.
+    :param width: The length of each combination.
+    :param seq_length: The amount of each possible types
+    :return: None.
+    """
+    json_io.write('[')
+    for index, permutation in enumerate(itertools.product(range(seq_length), repeat=width)):
+        if index:
+            json_io.write(', ')
+        json_io.write(json.dumps(permutation))
+    json_io.write(']')
 
 
 def generate_permutations_with_replacement(width: int, seq_length: int) -> typing.List[typing.Tuple[int, ...]]:
@@ -38,7 +55,7 @@ def generate_permutations_with_replacement(width: int, seq_length: int) -> typin
     :param seq_length: The amount of each possible types
     :return: A list containing all possible permutations with replacement.
     """
-    return [permutation for permutation in itertools.product(range(seq_length), repeat=width)]
+    return list(itertools.product(range(seq_length), repeat=width))
 
 
 if __name__ == "__main__":
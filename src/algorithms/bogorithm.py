@@ -2,51 +2,54 @@
 #  SPDX-License-Identifier: BSD 3-Clause                                                                               -
 #  Copyright (c) 2022 Jimmy Bierenbroodspot.                                                                           -
 # ----------------------------------------------------------------------------------------------------------------------
-"""A mastermind algorithm that tries to use the fundamentals of bogosort to solve a game of mastermind. It pops a random
-combination from the pool of possible combinations and checks if it is the correct code, then repeats. This is obviously
-horrifically inefficient.
-    This algorithm needs at best 1 guess and at most n^r, where n = the amount of objects and r = the sample size, guesses.
-Because the probability of each amount of guesses to win the game (k) is equally distributed the average amount of
-guesses needed by this algorithm is n^r/2. For a standard game of mastermind (n = 6 and r = 4) is this 6^4/2 = 1296/2 =
-648 and since this number for most algorithms is around 3 or 4 makes bogorithm orders of magnitude worse than most
-algorithms out there.
-    This could be improved on by reducing the incompatible codes from the pool of possible guesses. This makes it the
-simple algorithm but with a random guess rather than the first pick from the pool.
+"""A mastermind algorithm that tries to use the fundamentals of bogosort to solve a game of mastermind. It picks a
+random combination from the pool of possible combinations and checks if it is the correct code, then repeats.
+    Without reducing the pool this was horrifically inefficient: it needed at best 1 guess and at most n^r guesses,
+where n = the amount of objects and r = the sample size. Because every amount of guesses was equally likely the average
+was n^r/2, which for a standard game of mastermind (n = 6 and r = 4) is 6^4/2 = 1296/2 = 648 guesses.
+    After every guess all combinations that are incompatible with the answer are now removed from the pool, which makes
+it the simple algorithm but with a random guess rather than the first pick from the pool. For a standard game it wins
+in 1 to 8 guesses and on average in about 4.6 guesses.
 """
 import typing
 import random
 
-import src.python.mastermind.mastermind as game
+import src.mastermind as game
 import initialization as init
 
-# Overwrite game length to max amount of guesses.
+# A random pick is not guaranteed to stay within the standard 8 rounds, so the game length is set to the amount of
+# combinations, which the pool can never exceed.
 init.GAME_LENGTH = 1296
 
 
-def main() -> None:
-    game_simulation: typing.Generator[typing.Tuple[int, int, bool], game.Code, None]
-    answer: typing.Tuple[int, int, bool]
-    guess: game.Code
-    game_round: int = 0
-    possible_combinations: typing.List[game.Code] = init.get_combinations()
+def main(verbose: bool = False) -> None:
+    secret_code: game.Code
+    answer: typing.Tuple[int, int]
+    guess_index: int
+    combinations: typing.Tuple[game.Code, ...] = init.get_combinations()
+    possible_indices: typing.List[int] = list(range(len(combinations)))
 
-    game_simulation = game.simulate_game(
-        init.COLOURS, init.GAME_LENGTH, init.GAME_WIDTH
-    )
-    for _ in game_simulation:
-        game_round += 1
+    # Shuffling once up front means the first possible combination is a random pick in every round, since reducing
+    # keeps the order of the pool intact.
+    random.shuffle(possible_indices)
 
-        guess = possible_combinations.pop(
-            random.randint(0, len(possible_combinations) - 1)
-        )
-        answer = game_simulation.send(guess)
+    secret_code = game.generate_secret_code(init.COLOURS, init.GAME_WIDTH)
+    for game_round in range(1, init.GAME_LENGTH + 1):
+        # There is no need to remove the guess from the pool here since it can never be compatible with its own answer
+        # unless the game is won.
+        guess_index = possible_indices[0]
+        answer = game.compare_codes(secret_code, combinations[guess_index], len(init.COLOURS))
+        if verbose:
+            print(f"Guessed: {combinations[guess_index]}; answer: {answer}")
 
-        if answer[2]:
+        if game.is_won(answer, init.GAME_WIDTH):
             print(f"Game won in {game_round} guesses!")
             break
+
+        possible_indices = init.reduce_indices(possible_indices, guess_index, answer)
     else:
         print("Game lost.")
 
 
 if __name__ == "__main__":
-    main()
+    main(init.get_arguments().verbose)
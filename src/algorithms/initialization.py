@@ -4,10 +4,12 @@
 # ----------------------------------------------------------------------------------------------------------------------
 """A module containing some constants, types and functions which are commonly shared between algorithms."""
 import typing
-import json
+import functools
+import itertools
+import argparse
 
 import scripts.generate_set as generate_set
-import src.python.mastermind.mastermind as game
+import src.mastermind as game
 
 # These constants are declared here because they remain the same value in the entire module since I haven't implemented
 # a way to customize them yet
@@ -15,42 +17,80 @@ GAME_WIDTH: int = 4
 GAME_LENGTH: int = 8
 COLOURS: typing.Tuple[int, ...] = tuple(num for num in range(6))
 
-# Create generic Json type for ease of use, this has no actual functionality other than showing that something is a
-# json serialized object.
-Json: typing.Generic = typing.TypeVar("Json")
 
+def get_arguments() -> argparse.Namespace:
+    """Parses the arguments shared by all algorithms.
 
-def get_combinations() -> Json:
-    """Retrieves a list of all possible combinations from combinations.json.
+    :return: An argparse.Namespace object with all parsed arguments.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument('--verbose', '-v', help='Prints every guess and answer', action='store_true')
+
+    return parser.parse_args()
+
+
+@functools.lru_cache(maxsize=None)
+def get_combinations() -> typing.Tuple[game.Code, ...]:
+    """Generates all possible combinations. The combinations only depend on COLOURS and GAME_WIDTH so they are
+    generated once and the same tuple is returned on every following call.
+
+    :return: A tuple with all possible combinations.
+    """
+    return tuple(generate_set.generate_permutations_with_replacement(GAME_WIDTH, len(COLOURS)))
+
+
+def pack_score(score: typing.Tuple[int, int]) -> int:
+    """Packs a score into a single integer where the upper 4 bits hold the correct positions and the lower 4 bits the
+    correct colours in an incorrect position.
 
-    :return: A Json serialized object with all possible combinations.
+    :param score: A tuple containing 2 integers.
+    :return: An integer between 0 and 255.
+    """
+    return score[0] << 4 | score[1]
+
+
+@functools.lru_cache(maxsize=None)
+def get_scores(index: int) -> bytes:
+    """Scores every combination against the combination at the given index, this is a single row of the score table.
+    Rows are only calculated the first time they are needed, so algorithms that only use a few rows never pay for the
+    entire table.
+
+    :param index: The index of a combination in get_combinations.
+    :return: A bytes object holding the packed score of every combination against the combination at index.
     """
-    json_io: typing.TextIO
-    json_string: str
+    combinations: typing.Tuple[game.Code, ...] = get_combinations()
+    compare_codes: typing.Callable = game.specialize_compare_codes(GAME_WIDTH, len(COLOURS))
+
+    # Both maps are iterated from within bytes(), so the whole row is scored without a Python level loop.
+    return bytes(map(pack_score, map(compare_codes, itertools.repeat(combinations[index]), combinations)))
 
-    # Generate dataset with possible combinations
-    generate_set.main()
 
-    with open("./combinations.json", "r") as json_io:
-        json_string = json_io.read()
+@functools.lru_cache(maxsize=None)
+def get_score_table() -> typing.Tuple[bytes, ...]:
+    """Scores every combination against every other combination. Since compare_codes is a pure function with a small
+    domain all scores are calculated once, after which a score is a lookup in this table.
 
-    return json.loads(json_string)
+    :return: A tuple where index i holds a bytes object with the packed score of combination i against every
+    combination.
+    """
+    return tuple(map(get_scores, range(len(get_combinations()))))
 
 
-def reduce(
-    possible_combinations: Json, guess: game.Code, score: typing.Tuple[int, int]
-) -> Json:
-    """Compares the score of all combinations in possible_combinations against the given score.
+def reduce_indices(
+    possible_indices: typing.List[int], guess_index: int, score: typing.Tuple[int, int]
+) -> typing.List[int]:
+    """Compares the score of all combinations in possible_indices against the given score, using the precomputed
+    score table instead of comparing codes.
 
-    :param possible_combinations: A list of possible combinations.
-    :param guess: A sequence containing integers.
+    :param possible_indices: A list of indices of possible combinations.
+    :param guess_index: The index of the guessed combination.
     :param score: A tuple containing 2 integers.
-    :return: A list
+    :return: A list with the indices of all combinations that are still possible.
     """
-    # Using a list comprehension is absolutely useless here because game.compare_codes is a relatively expensive
-    # function. I just really like writing comprehensions.
-    return [
-        possible_combination
-        for possible_combination in possible_combinations
-        if score == game.compare_codes(guess, possible_combination)
-    ]
+    scores: bytes = get_scores(guess_index)
+
+    # Looking up the scores, comparing them and selecting the indices is all chained together so the entire pool is
+    # filtered within C without ever going through a Python level loop.
+    return list(itertools.compress(
+        possible_indices, map(pack_score(score).__eq__, map(scores.__getitem__, possible_indices))
+    ))
@@ -0,0 +1,66 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#  SPDX-License-Identifier: BSD 3-Clause                                                                               -
+#  Copyright (c) 2022 Jimmy Bierenbroodspot.                                                                           -
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+Mastermind solving algorithm using D. E. Knuth's minimax algorithm.
+
+This code is developed using the algorithm described in the following article:
+Knuth, D. E. (1976). The computer as master mind. Journal of Recreational Mathematics, 9(1), 1-6.
+"""
+import typing
+import collections
+
+import initialization as init
+import src.mastermind as game
+
+
+def main(verbose: bool = False) -> None:
+    secret_code: game.Code
+    guess_index: int
+    answer: typing.Tuple[int, int]
+    combinations: typing.Tuple[game.Code, ...] = init.get_combinations()
+    possible_indices: typing.List[int] = list(range(len(combinations)))
+
+    secret_code = game.generate_secret_code(init.COLOURS, init.GAME_WIDTH)
+    for game_round in range(1, init.GAME_LENGTH + 1):
+        guess_index = get_minimax_guess(possible_indices)
+        answer = game.compare_codes(secret_code, combinations[guess_index], len(init.COLOURS))
+        if verbose:
+            print(f"Guessed: {combinations[guess_index]}; answer: {answer}")
+
+        # Check if the game is won
+        if game.is_won(answer, init.GAME_WIDTH):
+            print(f"Game won in {game_round} guesses!")
+            break
+
+        possible_indices = init.reduce_indices(possible_indices, guess_index, answer)
+    else:
+        print("Game lost.")
+
+
+def get_minimax_guess(possible_indices: typing.List[int]) -> int:
+    """Finds the guess that leaves the least possible combinations in the worst case. Every combination is considered
+    as a guess, not only the ones that are still possible.
+
+    :param possible_indices: A list of indices of possible combinations.
+    :return: The index of the guess with the smallest worst case, a possible combination is preferred over an
+    impossible one and otherwise the lowest index is picked.
+    """
+    possible_set: typing.Set[int] = set(possible_indices)
+    score_table: typing.Tuple[bytes, ...] = init.get_score_table()
+    # For every guess the possible combinations are divided over the answers they would give, the largest of these
+    # partitions is the amount of combinations left in the worst case.
+    worst_cases: typing.List[int] = [
+        max(collections.Counter(map(scores.__getitem__, possible_indices)).values())
+        for scores in score_table
+    ]
+
+    return min(
+        range(len(score_table)),
+        key=lambda index: (worst_cases[index], index not in possible_set, index),
+    )
+
+
+if __name__ == "__main__":
+    main(init.get_arguments().verbose)
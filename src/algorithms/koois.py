@@ -9,108 +9,81 @@ This code is developed using pseudocode found in the following article:
 Kooi, B. (2005). Yet another mastermind strategy. ICGA Journal, 28(1), 13-20.
 """
 import typing
-import collections
 
 import initialization as init
-import src.python.mastermind.mastermind as game
-
-
-def main() -> None:
-    game_simulation: typing.Generator[typing.Tuple[int, int, bool], game.Code, None]
-    guess: game.Code
-    answer: typing.Tuple[int, int, bool]
-    categories: typing.Set[game.Code]
-    partition_counts: typing.Dict[game.Code, int]
-    largest_category: game.Code
-    game_round: int = 0
-    combinations: init.Json = init.get_combinations()
-
-    game_simulation = game.simulate_game(
-        init.COLOURS, init.GAME_LENGTH, init.GAME_WIDTH
-    )
-    for _ in game_simulation:
-        game_round += 1
-
-        # Find all categories left in the combinations and count the partitions.
-        categories = get_all_categories(combinations)
-        partition_counts = {
-            category: get_partition_count(combinations, category)
-            for category in categories
-        }
-        # Find the largest category.
-        largest_category = max(partition_counts, key=partition_counts.get)
-        guess = next(
-            combination
-            for combination in combinations
-            if get_category(combination) == largest_category
-        )
-        answer = game_simulation.send(guess)
-        print(f"Guessed: {guess}; answer: {answer}")
+import src.mastermind as game
+
+
+def main(verbose: bool = False) -> None:
+    secret_code: game.Code
+    guess_index: int
+    answer: typing.Tuple[int, int]
+    category: typing.Tuple[int, ...]
+    seen_categories: typing.Set[typing.Tuple[int, ...]]
+    partition_count: int
+    most_partitions: int
+    combinations: typing.Tuple[game.Code, ...] = init.get_combinations()
+    possible_indices: typing.List[int] = list(range(len(combinations)))
+    # The category of a combination never changes, so they are all decided once before the game starts.
+    category_of: typing.List[typing.Tuple[int, ...]] = [get_category(combination) for combination in combinations]
+
+    secret_code = game.generate_secret_code(init.COLOURS, init.GAME_WIDTH)
+    for game_round in range(1, init.GAME_LENGTH + 1):
+        # Walk through the possible combinations once and count the partitions of the first combination of every
+        # category, the strategy treats all combinations in a category alike. The combination with the most partitions
+        # is guessed.
+        seen_categories = set()
+        most_partitions = 0
+        for index in possible_indices:
+            category = category_of[index]
+            if category in seen_categories:
+                continue
+            seen_categories.add(category)
+
+            partition_count = get_partition_count(possible_indices, index)
+            if partition_count > most_partitions:
+                most_partitions = partition_count
+                guess_index = index
+
+        answer = game.compare_codes(secret_code, combinations[guess_index], len(init.COLOURS))
+        if verbose:
+            print(f"Guessed: {combinations[guess_index]}; answer: {answer}")
 
         # Check if the game is won
-        if answer[2]:
+        if game.is_won(answer, init.GAME_WIDTH):
             print(f"Game won in {game_round} guesses!")
             break
 
-        combinations = init.reduce(combinations, guess, answer[:2])
+        possible_indices = init.reduce_indices(possible_indices, guess_index, answer)
     else:
         print("Game lost.")
 
 
-def get_category(combination: game.Code) -> game.Code:
+def get_category(combination: game.Code) -> typing.Tuple[int, ...]:
     """Decides the category of a combination. In most papers these categories are describes as: AAAA, AAAB, AABB, AABC
     and ABCD.
 
     :param combination: A Code combination of any width.
-    :return: A list that substitutes the letters in a category for integers in such that AABC == [0, 0, 1, 2].
+    :return: A tuple with the amount of times each colour appears in descending order such that AABC == (2, 1, 1).
     """
-    # Creates a list of values within the counter, we do not actually know to which number each value belongs.
-    combination_counts: typing.List[int] = sorted(
-        collections.Counter(combination).values(), reverse=True
-    )
-    category: game.Code = []  # This could've been a comprehension...
+    # We do not need to know which colour belongs to which count, so the counts of all colours in the combination are
+    # simply sorted.
+    return tuple(sorted((combination.count(colour) for colour in set(combination)), reverse=True))
 
-    # Appends the amount each colour (number) appears in the combination.
-    for counter, combination_count in enumerate(combination_counts):
-        category.extend([counter] * combination_count)
 
-    return tuple(category)
+def get_partition_count(possible_indices: typing.List[int], index: int) -> int:
+    """Finds the amount a given combination can be partitioned in by looking up the answers it would get against every
+    possible combination.
 
-
-def get_partition_count(
-    possible_combinations: init.Json, combination: game.Code
-) -> int:
-    """Finds the amount a given combination can be partitioned in by comparing the codes and calculating the possible
-    answer.
-
-    :param possible_combinations: A list with unique Code combinations.
-    :param combination: A Code combination.
+    :param possible_indices: A list with the indices of possible combinations.
+    :param index: The index of a combination.
     :return: The amount of possible partitions.
     """
-    # Comprehensions are fun, aren't they?
-    return len(
-        collections.Counter(
-            [
-                game.compare_codes(combination, possible_combination)
-                for possible_combination in possible_combinations
-            ]
-        )
-    )
-
-
-def get_all_categories(
-    possible_combinations: init.Json,
-) -> typing.Set[typing.Tuple[int]]:
-    """Gets all categories in a list of combinations.
-
-    :param possible_combinations: A list of possible combinations.
-    :return: A set with one of every available category.
-    """
-    return {
-        tuple(get_category(possible_combination))
-        for possible_combination in possible_combinations
-    }
+    scores: bytes = init.get_scores(index)
+
+    # Only the amount of distinct scores matters so they are put in a set rather than counted.
+    return len(set(map(scores.__getitem__, possible_indices)))
 
 
 if __name__ == "__main__":
-    main()
+    main(init.get_arguments().verbose)
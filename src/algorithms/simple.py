@@ -11,34 +11,33 @@ Sterling, L., & Shapiro, E. (1994). The art of Prolog: advanced programming tech
 from __future__ import annotations
 import typing
 
-import src.python.mastermind.mastermind as game
+import src.mastermind as game
 import initialization as init
 
 
-def main() -> None:
-    game_simulation: typing.Generator[typing.Tuple[int, int, bool], game.Code, None]
+def main(verbose: bool = False) -> None:
+    secret_code: game.Code
     guess: game.Code
-    answer: typing.Tuple[int, int, bool]
-    game_round: int = 0
-    possible_combinations: init.Json = init.get_combinations()
+    answer: typing.Tuple[int, int]
+    combinations: typing.Tuple[game.Code, ...] = init.get_combinations()
+    possible_indices: typing.List[int] = list(range(len(combinations)))
 
-    game_simulation = game.simulate_game(init.COLOURS, init.GAME_LENGTH, init.GAME_WIDTH)
-    for _ in game_simulation:
-        game_round += 1
-
-        guess = possible_combinations[0]
-        answer = game_simulation.send(guess)
-        print(f"Guessed: {guess}; answer: {answer}")
+    secret_code = game.generate_secret_code(init.COLOURS, init.GAME_WIDTH)
+    for game_round in range(1, init.GAME_LENGTH + 1):
+        guess = combinations[possible_indices[0]]
+        answer = game.compare_codes(secret_code, guess, len(init.COLOURS))
+        if verbose:
+            print(f"Guessed: {guess}; answer: {answer}")
 
         # Check if the game is won
-        if answer[2]:
-            print(f'Game won in {game_round + 1} guesses!')
+        if game.is_won(answer, init.GAME_WIDTH):
+            print(f'Game won in {game_round} guesses!')
             break
 
-        possible_combinations = init.reduce(possible_combinations, guess, answer[:2])
+        possible_indices = init.reduce_indices(possible_indices, possible_indices[0], answer)
     else:
         print('Game lost.')
 
 
 if __name__ == "__main__":
-    main()
+    main(init.get_arguments().verbose)
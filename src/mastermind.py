@@ -6,15 +6,20 @@
 
 A game of mastermind designed to be as modular as possible. If this module is directly executed you can play a
 rudimentary game of mastermind in the terminal. This way is clunky and low-effort since this is not the intended UI.
+
+Colours are represented by non-negative integers. compare_codes counts colours in a list indexed by colour, so every
+colour in the codes it compares has to be in range(colour_amount).
 """
 import typing
 import random
-import collections
+import functools
 import os
 import logging
 import argparse
+import string
 
-Code: typing.Union[typing.Tuple[int, ...], typing.List[int]] = typing.TypeVar('Code')
+# A code is a sequence of colours, which are represented by integers.
+Code = typing.Union[typing.Tuple[int, ...], typing.List[int]]
 
 GAME_HEADER: str = """# ---------------------------------------------- MasterMind -------------------------------------\
 --------------------- #
@@ -33,16 +38,22 @@ GAME_HEADER: str = """# ---------------------------------------------- MasterMin
 # -------------------------------------------------------------------------------------------------------------------- #
 """
 
+# Logging is relative to the working directory, so the location only has to be joined once.
+_LOG_LOCATION: str = os.path.join('logs', 'mastermind-debug.log')
+
+# Translation table that deletes every whitespace character from a string in a single pass.
+_WHITESPACE_TABLE: typing.Dict[int, None] = str.maketrans('', '', string.whitespace)
+
 
 def _init_logging() -> None:
     """Initializes logging by configuring logging and setting the logging location.
 
     :return: None.
     """
-    log_location: str = os.path.join(os.getcwd(), 'logs', 'mastermind-debug.log')
-    os.makedirs(os.path.dirname(log_location), exist_ok=True)
+    if not os.path.isdir(os.path.dirname(_LOG_LOCATION)):
+        os.makedirs(os.path.dirname(_LOG_LOCATION), exist_ok=True)
     logging.basicConfig(
-        filename=log_location,
+        filename=_LOG_LOCATION,
         encoding='utf-8',
         level=logging.DEBUG,
         format='%(asctime)s %(levelname)-8s %(message)s',
@@ -76,42 +87,73 @@ def generate_secret_code(colours: typing.Tuple[int, ...], length: int) -> Code:
     return tuple(random.choices(colours, k=length))
 
 
-def compare_codes(secret: Code, to_compare: Code) -> typing.Tuple[int, int]:
+def compare_codes(secret: Code, to_compare: Code, colour_amount: int) -> typing.Tuple[int, int]:
     """Takes two tuples and returns whether a colour is the correct colour and in the correct position or incorrect
      position but correct colour.
 
     :param secret: The secret code to compare against.
     :param to_compare: Input code to compare with.
+    :param colour_amount: Amount of possible colours, every colour has to be in range(colour_amount). Colours at or
+    above this raise an IndexError and negative colours are counted wrongly.
     :return: A tuple where the first index is correct order, correct position and the second is incorrect position but
     correct colour.
     """
     correct_order: int = 0
     incorrect_order: int = 0
-    # Counter here is used to create a dictionary-like object with the frequency of every colour.
-    frequencies: typing.List[typing.Counter] = [
-        collections.Counter(secret),
-        collections.Counter(to_compare),
-    ]
-
-    # Enumerate() creates <class 'enumerate'> type object which consists of index, value tuple pairs for each item in an
-    # iterable. Here I create two enumerate objects and compare them against each other. If there is a match it means
-    # both the colour and the index, thus position, are the same which means a colour is in the right position.
-    for index, colour in enumerate(secret):
-        if (index, colour) in enumerate(to_compare):
+    # A list indexed by colour is used to store the frequency of every colour, which is a lot cheaper than hashing every
+    # colour into a dictionary.
+    frequencies: typing.List[typing.List[int]] = [[0] * colour_amount, [0] * colour_amount]
+
+    # Both codes are walked through only once, if both colours on the same index are the same a colour is in the right
+    # position. Only the colours that are not in the right position are counted in the frequencies.
+    for secret_colour, compare_colour in zip(secret, to_compare):
+        if secret_colour == compare_colour:
             correct_order += 1
+        else:
+            frequencies[0][secret_colour] += 1
+            frequencies[1][compare_colour] += 1
 
-    # The frequencies are compared to each other and once a match is found incorrect_order is incremented by the lowest
-    # frequency.
-    for colour in frequencies[0]:
-        if colour in frequencies[1]:
-            incorrect_order += min(frequencies[0][colour], frequencies[1][colour])
-    logging.debug(f'{frequencies}\t{incorrect_order, incorrect_order}')
-    # Since we know that an equal amount of correct pairs are marked as incorrect order
-    incorrect_order -= correct_order
+    # The lowest frequency of every remaining colour is the amount of times that colour is correct but in an incorrect
+    # position.
+    for secret_frequency, compare_frequency in zip(*frequencies):
+        incorrect_order += min(secret_frequency, compare_frequency)
 
     return correct_order, incorrect_order
 
 
+@functools.lru_cache(maxsize=None)
+def specialize_compare_codes(board_width: int,
+                             colour_amount: int) -> typing.Callable[[Code, Code], typing.Tuple[int, int]]:
+    """Generates a version of compare_codes for a fixed board width and amount of colours. Since both are known the
+    loops in compare_codes can be written out completely, which leaves only straight-line code.
+
+    :param board_width: Width of the board.
+    :param colour_amount: Amount of possible colours.
+    :return: A function that takes the same codes as compare_codes and returns the same tuple.
+    """
+    namespace: typing.Dict[str, typing.Any] = {}
+    source: typing.List[str] = [
+        'def compare_codes(secret, to_compare):',
+        '    correct_order = 0',
+        f'    secret_frequencies = [0] * {colour_amount}',
+        f'    compare_frequencies = [0] * {colour_amount}',
+    ]
+
+    for index in range(board_width):
+        source.append(f'    if secret[{index}] == to_compare[{index}]:')
+        source.append('        correct_order += 1')
+        source.append('    else:')
+        source.append(f'        secret_frequencies[secret[{index}]] += 1')
+        source.append(f'        compare_frequencies[to_compare[{index}]] += 1')
+    source.append('    return correct_order, ' + ' + '.join(
+        f'min(secret_frequencies[{colour}], compare_frequencies[{colour}])' for colour in range(colour_amount)
+    ))
+
+    exec('\n'.join(source), namespace)
+
+    return namespace['compare_codes']
+
+
 # All bools start with is, right?
 def is_won(correctness: typing.Tuple[int, int], board_width: int) -> bool:
     """Compares the left of correctness against the width of the board.
@@ -160,10 +202,10 @@ def clean_user_input(user_input: str) -> Code:
     :return: A Code list populated by integers if input is numeric, otherwise an empty list is returned.
     """
     cleaned_code: Code = []
-    user_input = user_input.replace(' ', '')  # Remove all whitespace.
+    user_input = user_input.translate(_WHITESPACE_TABLE)  # Remove all whitespace.
 
     if user_input.isnumeric():
-        cleaned_code = [int(character) for character in user_input]
+        cleaned_code = list(map(int, user_input))
 
     return cleaned_code
 
@@ -174,7 +216,8 @@ def simulate_game(colours: typing.Tuple[int, ...],
     """A game of mastermind where you compare user input against a computer generated code where the correctness of this
     code will be yielded after every round.
 
-    :param colours: All possible colours to choose from.
+    :param colours: All possible colours to choose from, these have to be non-negative integers. Guesses may only
+    contain these colours.
     :param game_length: Amount of rounds.
     :param board_width: Width of the board.
     :return: The amount of correct positions, correct colour but incorrect position and whether the game is won or not.
@@ -194,18 +237,23 @@ def simulate_game(colours: typing.Tuple[int, ...],
     won: bool
     correctness: typing.Tuple[int, int]
     secret_code: Code = generate_secret_code(colours, board_width)
-    logging.debug(f'Secret code is:\t{secret_code}')
+    # The colours do not have to start at 0 or be consecutive, so the highest colour decides the amount of frequencies.
+    compare: typing.Callable[[Code, Code], typing.Tuple[int, int]] = specialize_compare_codes(board_width,
+                                                                                              max(colours) + 1)
+    # The arguments are passed to logging separately so the message is only formatted when debugging is enabled.
+    logging.debug('Secret code is:\t%s', secret_code)
 
     for _ in range(game_length):
         # Whenever yield is to the right of an equal sign, and you call generator.send() it will assign that value to
         # whatever is left of the equals sign.
         guess = yield
-        logging.debug(f'Guessed code is:\t{guess}')
+        logging.debug('Guessed code is:\t%s', guess)
 
         # Compares the guess against the secret code.
-        correctness = compare_codes(secret_code, guess)
-        won = is_won(correctness, board_width)
-        logging.debug(f'{colours}\tCorrectness for this round:\t{correctness}')
+        correctness = compare(secret_code, guess)
+        # is_won is inlined here to save a function call every round.
+        won = correctness[0] == board_width
+        logging.debug('Correctness for this round:\t%s', correctness)
 
         # If won is True the last correctness is yielded and the generator is terminated.
         if won: